@@ -3,6 +3,8 @@
 # For the full list of built-in configuration values, see the documentation:
 # https://www.sphinx-doc.org/en/master/usage/configuration.html
 
+import functools
+import os
 import sys
 from pathlib import Path
 
@@ -14,12 +16,14 @@ else:
 
 PROJECT_ROOT = Path(__file__).parents[1]
 
+# Set PS_FAST_DOCS=1 to skip the notebooks and code links for faster local builds
+FAST_DOCS = os.environ.get("PS_FAST_DOCS", "").lower() not in ("", "0", "false")
 
+
+@functools.cache
 def get_version() -> str:
     """Get the version from the pyproject.toml file."""
-    with open(PROJECT_ROOT / "pyproject.toml", "rb") as f:
-        pyproject = tomllib.load(f)
-
+    pyproject = tomllib.loads((PROJECT_ROOT / "pyproject.toml").read_text("utf-8"))
     return pyproject["project"]["version"]
 
 
@@ -36,7 +40,6 @@ release = get_version()
 extensions = [
     "sphinx.ext.napoleon",  # Docstrings
     "sphinx_rtd_theme",  # Theme
-    "sphinx.ext.autodoc",  # Source code documentation
     "sphinx.ext.intersphinx",  # Link to external documentation
     "autoapi.extension",  # Automatic API generation
     "sphinx.ext.linkcode",  # Link to Github code
@@ -78,9 +81,8 @@ autoapi_options = [
     "imported-members",
 ]
 autoapi_root = "autoapi"
-autoapi_keep_files = False
+autoapi_keep_files = True
 keep_warnings = True
-autodoc_typehints = "signature"
 
 # Notebook formatting
 source_suffix = {
@@ -95,28 +97,38 @@ nb_custom_formats = {
 nb_execution_in_temp = True
 nb_execution_allow_errors = False
 
+if FAST_DOCS:
+    _slow_extensions = {"myst_nb", "sphinx_copybutton", "sphinx.ext.linkcode"}
+    extensions = [ext for ext in extensions if ext not in _slow_extensions]
+    exclude_patterns.append("notebooks")
+    source_suffix = {".rst": "restructuredtext"}
+    del nb_custom_formats, nb_execution_in_temp, nb_execution_allow_errors
+
+
+# linkcode is not aware of import in __init__, so need to do some annoying
+# duplication here. Could perhaps be replaced by importing each function and
+# checking `__module__`.
+_LINKCODE_FILES = {
+    "random_seeds": "_utils.py",
+    "__version__": "_version.py",
+}
+_LINKCODE_BASE = "https://github.com/befelix/pydantic_sweep/blob/main/src/"
+
 
 def linkcode_resolve(domain: str, info: dict) -> str | None:
     """Link to code on Github."""
     # https://www.sphinx-doc.org/en/master/usage/extensions/linkcode.html#module-sphinx.ext.linkcode
     if domain != "py":
         return None
-    if not info["module"]:
+    module = info["module"]
+    if not module:
         return None
-    # linkcode is not aware of import in __init__, so need to do some annoying
-    # duplication here. Could perhaps be replaced by importing each function and
-    # checking `__module__`.
-    filename = info["module"].replace(".", "/")
-    py_obj_name = info["fullname"]
-    if filename.endswith(".types"):
-        filename = f"{filename}.py"
-    elif py_obj_name == "random_seeds":
-        filename = f"{filename}/_utils.py"
-    elif py_obj_name == "__version__":
-        filename = f"{filename}/_version.py"
-    else:
-        filename = f"{filename}/_model.py"
-    return f"https://github.com/befelix/pydantic_sweep/blob/main/src/{filename}"
+
+    filename = module.replace(".", "/")
+    if module.endswith(".types"):
+        return f"{_LINKCODE_BASE}{filename}.py"
+    file = _LINKCODE_FILES.get(info["fullname"], "_model.py")
+    return f"{_LINKCODE_BASE}{filename}/{file}"
 
 
 # -- Options for HTML output -------------------------------------------------
@@ -4,8 +4,11 @@
 # ]
 # ///
 
+import argparse
+import os
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 from config import ExperimentConfig
@@ -13,6 +16,14 @@ from config import ExperimentConfig
 import pydantic_sweep as ps
 from pydantic_sweep.cli import ModelDumpCLI
 
+parser = argparse.ArgumentParser()
+parser.add_argument(
+    "--in-process",
+    action="store_true",
+    help="Call train.main directly instead of starting a new process per experiment.",
+)
+args = parser.parse_args()
+
 # Construct experiment configurations
 experiments = ps.initialize(
     ExperimentConfig,
@@ -30,7 +41,9 @@ ps.check_unique(experiments)
 
 # Call the script with all experiment configurations
 script = Path(__file__).parent / "train.py"
-for experiment in experiments:
+
+
+def run(experiment: ExperimentConfig) -> None:
     # The runner and train script communicate via CLI arguments
     # pydantic-sweep provides helper functions for basic CLIs.
     cli_args = ModelDumpCLI.cli_args(experiment)
@@ -41,3 +54,21 @@ for experiment in experiments:
         [sys.executable, str(script), *cli_args],
         check=True,
     )
+
+
+if args.in_process:
+    # Avoids the interpreter startup per experiment, which is convenient for local
+    # debugging. Note that this requires the dependencies of train.py.
+    from train import main
+
+    for experiment in experiments:
+        main(experiment)
+else:
+    # Experiments are independent, so we can run several of them at the same time.
+    # Set PS_MAX_PARALLEL=1 to run them one after the other.
+    max_workers = int(os.environ.get("PS_MAX_PARALLEL", 0)) or os.cpu_count()
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = [pool.submit(run, experiment) for experiment in experiments]
+        for future in as_completed(futures):
+            # Re-raises errors from the subprocess call
+            future.result()
@@ -13,6 +13,8 @@ from ._model import (
     config_zip,
     field,
     initialize,
+    initialize_iter,
+    iter_config_combine,
     model_replace,
 )
 from ._model_diff import model_diff
@@ -36,6 +38,8 @@ __all__ = [
     "config_zip",
     "field",
     "initialize",
+    "initialize_iter",
+    "iter_config_combine",
     "model_diff",
     "model_replace",
     "random_seeds",
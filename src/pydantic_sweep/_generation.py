@@ -1,13 +1,14 @@
 from __future__ import annotations
 
-import contextlib
-from collections.abc import Collection, Generator, Mapping
+from collections.abc import Collection, Mapping
 from enum import Enum
 from pathlib import Path
 from typing import Any, cast
 
 import pydantic
 
+from pydantic_sweep._utils import _SCALAR_TYPES
+
 __all__ = ["model_to_python"]
 
 
@@ -63,17 +64,21 @@ def model_to_python(
 
 def _generate_imports(classes: Collection[type[object]], /) -> list[str]:
     """Generate import statements for the given classes."""
-    if len(set(cls.__name__ for cls in classes)) != len(classes):
-        from collections import Counter
-
-        counts = Counter(cls.__name__ for cls in classes)
-        duplicates = [name for name, count in counts.items() if count > 1]
+    seen: dict[str, type[object]] = {}
+    duplicates: dict[str, None] = {}
+    imports = []
+    for cls in classes:
+        if seen.setdefault(cls.__name__, cls) is not cls:
+            duplicates[cls.__name__] = None
+        imports.append(f"from {cls.__module__} import {cls.__name__}")
+
+    if duplicates:
         raise ValueError(
             "The following models share the same name, but exist at different code "
             f"paths. This is currently not supported: {', '.join(duplicates)}."
         )
 
-    return [f"from {cls.__module__} import {cls.__name__}" for cls in classes]
+    return imports
 
 
 def _add_import(obj: Any, model_classes: set) -> None | str:
@@ -87,17 +92,18 @@ def _add_import(obj: Any, model_classes: set) -> None | str:
         return cls.__name__
 
 
-@contextlib.contextmanager
-def _wrapped(
-    whitespace: str, prefix: str, open: str, close: str, lines: list[str]
-) -> Generator[None, None, None]:
-    lines.append(f"{whitespace}{prefix}{open}")
-    yield
-    # Final line comma not needed (works better with auto-formatting)
-    lines[-1] = lines[-1].removesuffix(",")
-    if whitespace:
-        close += ","
-    lines.append(f"{whitespace}{close}")
+_WHITESPACE = tuple("    " * indent for indent in range(16))
+"""Pre-computed indentation for the common nesting depths."""
+
+
+class _Close:
+    """Stack marker that closes the currently open bracket."""
+
+
+def _whitespace(indent: int, /) -> str:
+    if indent < len(_WHITESPACE):
+        return _WHITESPACE[indent]
+    return "    " * indent
 
 
 def _add_python_code(
@@ -109,72 +115,77 @@ def _add_python_code(
     lines: list,
     model_classes: set,
 ) -> None:
-    whitespace = "    " * indent
-
-    if isinstance(model, pydantic.BaseModel):
-        type_name = _add_import(model, model_classes)
-        assert type_name is not None
-        assert isinstance(dump, dict)
-        open, close = f"{type_name}(", ")"
-        with _wrapped(whitespace, field_prefix, open, close, lines):
-            for key, dump_value in dump.items():
-                _add_python_code(
-                    model=getattr(model, key),
-                    field_prefix=f"{key}=",
-                    dump=dump_value,
-                    lines=lines,
-                    model_classes=model_classes,
-                    indent=indent + 1,
-                )
-    elif isinstance(model, list | tuple | set):
-        type_name = _add_import(model, model_classes=model_classes)
-
-        if isinstance(model, list):
-            open, close = "[", "]"
-        elif isinstance(model, tuple):
-            open, close = "[", "]"
-        elif isinstance(model, set):
-            open, close = "{", "}"
+    # Iterative depth-first traversal with an explicit stack. Children are pushed
+    # in reverse order so that they are emitted in their original order, followed
+    # by a `_Close` marker that carries the closing bracket in place of the dump.
+    stack: list[tuple[Any, str, Any, int]] = [(model, field_prefix, dump, indent)]
+    while stack:
+        model, field_prefix, dump, indent = stack.pop()
+        whitespace = _whitespace(indent)
+
+        if model is _Close:
+            # Final line comma not needed (works better with auto-formatting)
+            lines[-1] = lines[-1].removesuffix(",")
+            close = f"{dump}," if whitespace else dump
+            lines.append(f"{whitespace}{close}")
+            continue
+
+        # Scalars are emitted with repr, no need to check for enums, paths, etc.
+        if type(model) in _SCALAR_TYPES and type(dump) in _SCALAR_TYPES:
+            lines.append(f"{whitespace}{field_prefix}{dump!r},")
+            continue
+
+        if isinstance(model, pydantic.BaseModel):
+            type_name = _add_import(model, model_classes)
+            assert type_name is not None
+            assert isinstance(dump, dict)
+            open, close = f"{type_name}(", ")"
+            children = [
+                (getattr(model, key), f"{key}=", dump_value, indent + 1)
+                for key, dump_value in dump.items()
+            ]
+        elif isinstance(model, list | tuple | set):
+            type_name = _add_import(model, model_classes=model_classes)
+
+            if isinstance(model, list):
+                open, close = "[", "]"
+            elif isinstance(model, tuple):
+                open, close = "[", "]"
+            elif isinstance(model, set):
+                open, close = "{", "}"
+            else:
+                raise ValueError(f"Unsupported collection type: {type(model)}")
+
+            if type_name is not None:
+                open = f"{type_name}{open}"
+                close = f"{close})"
+
+            children = [
+                (model_item, "", dump_item, indent + 1)
+                for model_item, dump_item in zip(model, dump, strict=True)
+            ]
+        elif isinstance(model, dict):
+            type_name = _add_import(model, model_classes=model_classes)
+            if type_name is None:
+                open, close = "{", "}"
+            else:
+                open = f"{type_name}({{"
+                close = "})"
+
+            children = [
+                (model[key], f"{key!r}: ", dump_value, indent + 1)
+                for key, dump_value in dump.items()
+            ]
+        elif isinstance(dump, Enum):
+            enum_cls = _add_import(dump, model_classes=model_classes)
+            lines.append(f"{whitespace}{field_prefix}{enum_cls}.{dump.name},")
+            continue
         else:
-            raise ValueError(f"Unsupported collection type: {type(model)}")
-
-        if type_name is not None:
-            open = f"{type_name}{open}"
-            close = f"{close})"
-
-        with _wrapped(whitespace, field_prefix, open, close, lines):
-            for model_item, dump_item in zip(model, dump, strict=True):
-                _add_python_code(
-                    model=model_item,
-                    field_prefix="",
-                    dump=dump_item,
-                    lines=lines,
-                    model_classes=model_classes,
-                    indent=indent + 1,
-                )
-    elif isinstance(model, dict):
-        type_name = _add_import(model, model_classes=model_classes)
-        if type_name is None:
-            open, close = "{", "}"
-        else:
-            open = f"{type_name}({{"
-            close = "})"
-
-        with _wrapped(whitespace, field_prefix, open, close, lines):
-            for key, dump_value in dump.items():
-                _add_python_code(
-                    model=model[key],
-                    field_prefix=f"{key!r}: ",
-                    dump=dump_value,
-                    lines=lines,
-                    model_classes=model_classes,
-                    indent=indent + 1,
-                )
-    elif isinstance(dump, Enum):
-        enum_cls = _add_import(dump, model_classes=model_classes)
-        dump = f"{enum_cls}.{dump.name}"
-        lines.append(f"{whitespace}{field_prefix}{dump},")
-    else:
-        if isinstance(dump, Path):
-            dump = str(dump)
-        lines.append(f"{whitespace}{field_prefix}{dump!r},")
+            if isinstance(dump, Path):
+                dump = str(dump)
+            lines.append(f"{whitespace}{field_prefix}{dump!r},")
+            continue
+
+        lines.append(f"{whitespace}{field_prefix}{open}")
+        stack.append((_Close, "", close, indent))
+        stack.extend(reversed(children))
@@ -3,17 +3,21 @@ from __future__ import annotations
 import itertools
 import types
 import typing
-from collections.abc import Hashable, Iterable
-from typing import Any, Literal, TypeVar, overload
+import weakref
+from collections.abc import Hashable, Iterable, Iterator
+from typing import Any, Literal, TypeAlias, TypeVar, overload
 
-import more_itertools
 import pydantic
+from pydantic_core import PydanticCustomError
 
 from pydantic_sweep._nested_dict import (
+    _copy_nested,
     _flexible_config_to_nested,
+    _is_normalized,
+    _nested_dict_from_items_overwrite,
     merge_nested_dicts,
-    nested_dict_at,
     nested_dict_drop,
+    nested_dict_from_items,
     nested_dict_get,
     nested_dict_items,
     nested_dict_replace,
@@ -21,6 +25,7 @@ from pydantic_sweep._nested_dict import (
     path_to_str,
 )
 from pydantic_sweep._utils import (
+    _SCALAR_TYPES,
     as_hashable,
     iter_subtypes,
     notebook_link,
@@ -49,6 +54,8 @@ __all__ = [
     "config_zip",
     "field",
     "initialize",
+    "initialize_iter",
+    "iter_config_combine",
     "model_replace",
 ]
 
@@ -72,75 +79,120 @@ class BaseModel(
         By default, pydantic does not raise an error if multiple pydantic models in a
         union type could match the provided data.
         """
-        if isinstance(data, dict):
-            fields = cls.model_fields
-            for key, value in data.items():
-                # Only dicts needs special handling, since static values cannot
-                # represent nested models. This also covers the case if value is
-                # already a pydantic model.
-                if not isinstance(value, dict):
-                    continue
-
-                # extra items are handled by extra='forbid' model setting.
+        if not isinstance(data, dict):
+            return data
+
+        plan = _union_validation_plan(cls)
+        if not plan:
+            # Most models don't have any fields that need checking
+            return data
+
+        validated = {}
+        for key, value in data.items():
+            # Only dicts needs special handling, since static values cannot
+            # represent nested models. This also covers the case if value is
+            # already a pydantic model.
+            if not isinstance(value, dict):
+                continue
+
+            # extra items are handled by extra='forbid' model setting.
+            candidates = plan.get(key)
+            if candidates is None:
+                continue
+
+            # Manually validate each model.
+            matches = []
+            for candidate in candidates:
+                # Alive, since the candidates are referenced by the fields of cls
+                annotation = typing.cast(type[pydantic.BaseModel], candidate())
                 try:
-                    field = fields[key]
-                except KeyError:
-                    continue
-
-                # Discriminators are an alternative way to handle this
-                if field.discriminator is not None or any(
-                    isinstance(m, pydantic.Discriminator) for m in field.metadata
-                ):
-                    continue
-
-                # We focus on direct unions for now, since they will be the most
-                # common use-case. This does not check things like `tuple[Sub1 | Sub2]`.
-                origin = typing.get_origin(field.annotation)
-                if origin not in (typing.Union, types.UnionType):
-                    continue
-
-                # Manually validate each model.
-                matches = []
-                for annotation in typing.get_args(field.annotation):
-                    # Any other type should not need validation, since either they
-                    # can't match or, in the case of dictionaries, pydantic models
-                    # are preferred under the best-match strategy.
-                    if not isinstance(annotation, type):
-                        continue
-                    try:
-                        issub = issubclass(annotation, pydantic.BaseModel)
-                    except TypeError:
-                        continue
-
-                    if issub:
-                        try:
-                            res = annotation.model_validate(value)  # type: ignore[attr-defined]
-                        except pydantic.ValidationError:
-                            pass
-                        else:
-                            matches.append((annotation.__name__, res))
-
-                if len(matches) > 1:
-                    from pydantic_core import PydanticCustomError
-
-                    raise PydanticCustomError(
-                        "unsafe_union_error",
-                        "Multiple models of a Union type could match the provided "
-                        "data: {conflicts}. To avoid this error, either "
-                        "initialize the nested model manually using the `initialize` "
-                        "method or use a discriminated union. See {docs} for details.",
-                        dict(
-                            conflicts=", ".join([name for name, _ in matches]),
-                            docs=notebook_link("nested"),
-                        ),
-                    )
-                elif matches:
-                    # Avoid re-running the model validation downstream
-                    data[key] = matches[0][1]
+                    # Same as model_validate, without the Python-level wrapper
+                    res = annotation.__pydantic_validator__.validate_python(value)
+                except pydantic.ValidationError:
+                    pass
+                else:
+                    matches.append((annotation.__name__, res))
+
+            if len(matches) > 1:
+                raise PydanticCustomError(
+                    "unsafe_union_error",
+                    "Multiple models of a Union type could match the provided "
+                    "data: {conflicts}. To avoid this error, either "
+                    "initialize the nested model manually using the `initialize` "
+                    "method or use a discriminated union. See {docs} for details.",
+                    dict(
+                        conflicts=", ".join([name for name, _ in matches]),
+                        docs=notebook_link("nested"),
+                    ),
+                )
+            elif matches:
+                validated[key] = matches[0][1]
+
+        if validated:
+            # Avoid re-running the model validation downstream. The input is not
+            # modified inplace, since it may be shared with other configurations.
+            data = {**data, **validated}
 
         return data
 
 
+# Only weak references, since recursive models would otherwise keep their own cache
+# entries alive.
+_UnionCandidates: TypeAlias = tuple[weakref.ref[type[pydantic.BaseModel]], ...]
+
+_UNION_VALIDATION_PLANS: weakref.WeakKeyDictionary[
+    type[pydantic.BaseModel], dict[str, _UnionCandidates]
+] = weakref.WeakKeyDictionary()
+
+
+def _union_validation_plan(
+    cls: type[pydantic.BaseModel], /
+) -> dict[str, _UnionCandidates]:
+    """Fields of a model that are unions of pydantic models.
+
+    Returns a mapping from field name to (weak references to) the pydantic models in
+    the union. The result only depends on the class and is cached.
+    """
+    try:
+        return _UNION_VALIDATION_PLANS[cls]
+    except KeyError:
+        pass
+
+    plan = {}
+    for name, field in cls.model_fields.items():
+        # Discriminators are an alternative way to handle this
+        if field.discriminator is not None or any(
+            isinstance(m, pydantic.Discriminator) for m in field.metadata
+        ):
+            continue
+
+        # We focus on direct unions for now, since they will be the most
+        # common use-case. This does not check things like `tuple[Sub1 | Sub2]`.
+        origin = typing.get_origin(field.annotation)
+        if origin not in (typing.Union, types.UnionType):
+            continue
+
+        candidates = []
+        for annotation in typing.get_args(field.annotation):
+            # Any other type should not need validation, since either they
+            # can't match or, in the case of dictionaries, pydantic models
+            # are preferred under the best-match strategy.
+            if not isinstance(annotation, type):
+                continue
+            try:
+                issub = issubclass(annotation, pydantic.BaseModel)
+            except TypeError:
+                continue
+            if issub:
+                candidates.append(weakref.ref(annotation))
+
+        if candidates:
+            plan[name] = tuple(candidates)
+
+    _UNION_VALIDATION_PLANS[cls] = plan
+    return plan
+
+
 class NameMetaClass(type):
     """A metaclass that overwrite cls.__str__ to its name"""
 
@@ -191,6 +243,17 @@ def _check_model_config(
         )
 
 
+_CheckedModels: TypeAlias = tuple[tuple[StrictPath, type[pydantic.BaseModel]], ...]
+
+# The result of traversing a model class: the nested models that were found, and
+# whether there were any unhashable types. See ``check_model``. Nested models are only
+# referenced weakly, since recursive models would otherwise keep their own entry alive.
+_CHECKED_MODELS: weakref.WeakKeyDictionary[
+    type[pydantic.BaseModel],
+    tuple[tuple[tuple[StrictPath, weakref.ref[type[pydantic.BaseModel]]], ...], bool],
+] = weakref.WeakKeyDictionary()
+
+
 def check_model(
     model: pydantic.BaseModel | type[pydantic.BaseModel],
     /,
@@ -209,21 +272,55 @@ def check_model(
     unhashable :
         The action to take when a non-hashable type hint is encountered in the mode.
     """
+    cls = model if isinstance(model, type) else type(model)
+    cached = _CHECKED_MODELS.get(cls) if issubclass(cls, pydantic.BaseModel) else None
+
+    # The model structure is fixed once a class is complete, so we only need to
+    # re-traverse if we have to report unhashable types.
+    if cached is not None and (unhashable == "ignore" or cached[1]):
+        # Model configs are mutable, so those are always re-checked
+        _check_model_config(model, path=())
+        for path, sub_model in cached[0]:
+            # Alive, since nested models are referenced by the fields of cls
+            _check_model_config(typing.cast(type, sub_model()), path=path)
+        return
+
+    checked, hashable = _check_model_tree(model, unhashable=unhashable)
+    if checked and cls.__pydantic_complete__:
+        # Leave out the root model, which is the key itself
+        refs = tuple((path, weakref.ref(sub_model)) for path, sub_model in checked[1:])
+        _CHECKED_MODELS[cls] = (refs, hashable)
+
+
+def _check_model_tree(
+    model: Any, /, *, unhashable: Literal["warn", "ignore", "raise"]
+) -> tuple[_CheckedModels, bool]:
+    """Recursively check a model.
+
+    Returns the checked models with their paths, starting with the root model, and
+    whether all leaf types are hashable.
+    """
     to_check: list[tuple[StrictPath, Any]] = [((), model)]
-    checked = set()
+    checked: dict[type[pydantic.BaseModel], StrictPath] = {}
+    hashable = True
 
     while to_check:
         path, model = to_check.pop()
 
+        # Most fields are builtin types that do not need any checks
+        if type(model) is type and model in _SCALAR_TYPES:
+            continue
+
         if isinstance(model, pydantic.BaseModel):
-            name = model.__class__.__name__
+            cls = type(model)
         # Subclass can raise error for inputs that are not type
         # https://github.com/python/cpython/issues/101162
         elif isinstance(model, type) and issubclass(model, pydantic.BaseModel):
-            name = model.__name__
+            cls = model
         else:
             # Just a leaf node
             if isinstance(model, type) and not issubclass(model, Hashable):
+                hashable = False
                 info = _field_str(model, path=path)
                 raise_warn_ignore(
                     f"Non-hashable type {info}. These can lead to accidental "
@@ -232,6 +329,7 @@ def check_model(
                 )
             # Quirk: typing.Any is Hashable
             elif model is typing.Any:
+                hashable = False
                 field = path_to_str(path)
                 raise_warn_ignore(
                     f"Unconstrained variable (type Any) at field `{field}`. These "
@@ -241,18 +339,21 @@ def check_model(
                 )
             continue
 
-        if name in checked:
+        # Compare classes rather than names, which can collide across modules
+        if cls in checked:
             continue
 
         _check_model_config(model, path=path)
-        checked.add(name)
+        checked[cls] = path
+
+        to_check.extend(
+            ((*path, name), sub_type)
+            for name, field in cls.model_fields.items()
+            if field.annotation is not None
+            for sub_type in iter_subtypes(field.annotation)
+        )
 
-        cls = type(model) if isinstance(model, pydantic.BaseModel) else model
-        for name, field in cls.model_fields.items():
-            annotation = field.annotation
-            if annotation is not None:
-                for sub_type in iter_subtypes(annotation):
-                    to_check.append(((*path, name), sub_type))  # noqa: PERF401
+    return tuple((path, cls) for cls, path in checked.items()), hashable
 
 
 @overload
@@ -335,32 +436,14 @@ def initialize(
         # already on the parameter side.
         check_model(model, unhashable="ignore")
 
-    if constant is not None:
-        constant = _flexible_config_to_nested(constant)
-        configs = config_product(configs, [constant])
-
-    # Remove placeholders beforce merging with default values, otherwise we end up
-    # overwriting actual values in `default` with DefaultValue from the configs
-    configs = [
-        _flexible_config_to_nested(config, skip=DefaultValue) for config in configs
-    ]
-
-    if default is not None:
-        if not isinstance(default, dict):
-            raise TypeError(
-                f"Expected dictionary for input 'default', got '{type(default)}'."
-            )
-        # A DefaultValue as a default should not change anything
-        default = _flexible_config_to_nested(default, skip=DefaultValue)
-        configs = [
-            merge_nested_dicts(default, config, overwrite=True) for config in configs
-        ]
+    configs = _prepare_configs(configs, constant=constant, default=default)
 
     # Initialize a subconfiguration at the path ``at``
     if at is not None:
         if to is not None:
             raise ValueError("Only on of `to` and `at` can be provided, not both.")
 
+        configs = list(configs)
         subconfigs = [nested_dict_get(param, at, leaf=False) for param in configs]
         submodels = initialize(model, subconfigs)
         return [
@@ -369,7 +452,7 @@ def initialize(
         ]
 
     # Initialize the provided models
-    models = [model.model_validate(config) for config in configs]
+    models = _validate_models(model, configs)
 
     if to is not None:
         # Check not needed here: values are all pydantic.BaseModel by design
@@ -378,6 +461,138 @@ def initialize(
         return models
 
 
+_BATCH_VALIDATION_SIZE = 256
+"""Minimum number of configs for which batch validation pays off.
+
+Building the ``TypeAdapter`` costs about as much as validating ~100 models one by one,
+so we only use it for large sweeps.
+"""
+
+
+def _validate_models(
+    model: type[BaseModelT], configs: Iterable[Config], /
+) -> list[BaseModelT]:
+    """Validate configs, as a batch with a single call into pydantic-core if large.
+
+    If batch validation fails, we validate the first invalid config again on its own, so
+    that the error is the same as without batching.
+    """
+    configs = list(configs)
+    # Incomplete models are rebuilt (or raise a helpful error) in model_validate
+    if len(configs) < _BATCH_VALIDATION_SIZE or not model.__pydantic_complete__:
+        return [model.model_validate(config) for config in configs]
+
+    # Not cached, since the adapter would keep the (possibly dynamic) model alive
+    adapter = pydantic.TypeAdapter(list[model])  # type: ignore[valid-type]
+    try:
+        return adapter.validate_python(configs)
+    except pydantic.ValidationError as e:
+        index = e.errors()[0]["loc"][0]
+        if isinstance(index, int):
+            model.model_validate(configs[index])
+        raise
+
+
+def initialize_iter(
+    model: type[BaseModelT],
+    configs: Iterable[Config],
+    *,
+    constant: FlexibleConfig | Config | None = None,
+    default: FlexibleConfig | Config | None = None,
+    check: bool = True,
+) -> Iterator[BaseModelT]:
+    """Lazily instantiate the models with the given parameters.
+
+    This is the same as ``initialize``, but yields the models one by one instead of
+    returning a list. For large sweeps, this avoids keeping all models in memory at
+    the same time. The arguments are checked right away, while the models are only
+    validated on iteration.
+
+    >>> class Model(BaseModel):
+    ...     x: int
+
+    >>> for model in initialize_iter(Model, field("x", [1, 2])):
+    ...     print(model)
+    x=1
+    x=2
+    """
+    if check:
+        check_model(model, unhashable="ignore")
+
+    configs = _prepare_configs(configs, constant=constant, default=default)
+    return (model.model_validate(config) for config in configs)
+
+
+def _prepare_configs(
+    configs: Iterable[Config],
+    /,
+    *,
+    constant: FlexibleConfig | Config | None,
+    default: FlexibleConfig | Config | None,
+) -> Iterator[Config]:
+    """Merge constant and default values into configs and remove placeholders.
+
+    The arguments are checked eagerly, but the configs are processed lazily.
+    """
+    if constant is not None:
+        # Flatten the constant only once, but merge it lazily into each config. The
+        # config items come first, so that conflicts are reported for the config.
+        constant_items = list(nested_dict_items(_flexible_config_to_nested(constant)))
+        configs = (
+            nested_dict_from_items(
+                itertools.chain(nested_dict_items(config), constant_items)
+            )
+            for config in configs
+        )
+
+    # Remove placeholders beforce merging with default values, otherwise we end up
+    # overwriting actual values in `default` with DefaultValue from the configs
+    if default is None:
+        return map(_prune_default, configs)
+
+    if not isinstance(default, dict):
+        raise TypeError(
+            f"Expected dictionary for input 'default', got '{type(default)}'."
+        )
+    # A DefaultValue as a default should not change anything. We flatten the
+    # defaults only once, this is equivalent to merge_nested_dicts(overwrite=True).
+    default_items = list(
+        nested_dict_items(_flexible_config_to_nested(default, skip=DefaultValue))
+    )
+    # Prune and merge in a single pass over the configs
+    return (
+        _nested_dict_from_items_overwrite(
+            itertools.chain(default_items, nested_dict_items(_prune_default(config)))
+        )
+        for config in configs
+    )
+
+
+def _prune_default(config: Config, /) -> Config:
+    """Remove DefaultValue leaves and empty sub-dictionaries from a config.
+
+    The result never shares dictionaries with the input, since pydantic validators may
+    modify their input data inplace.
+    """
+    if not isinstance(config, dict) or not _is_normalized(config):
+        return _flexible_config_to_nested(config, skip=DefaultValue)
+    return _prune_default_normalized(config)
+
+
+def _prune_default_normalized(config: Config, /) -> Config:
+    """See _prune_default, for configs that are already normalized."""
+    pruned: Config = {}
+    for key, value in config.items():
+        if isinstance(value, dict):
+            value = _prune_default_normalized(value)
+            if not value:
+                continue
+        elif value is DefaultValue:
+            continue
+        pruned[key] = value
+    return pruned
+
+
 def model_replace(model: BaseModelT, *, values: FlexibleConfig) -> BaseModelT:
     """Create a copy of the pydantic model with nested value replacement.
 
@@ -411,6 +626,9 @@ def model_replace(model: BaseModelT, *, values: FlexibleConfig) -> BaseModelT:
     return model.model_validate(merged_config)
 
 
+_FIELD_VALUE_TYPES = (pydantic.BaseModel, Hashable)
+
+
 def field(
     path: Path, /, values: Iterable[FieldValue], *, check: bool = True
 ) -> list[Config]:
@@ -454,6 +672,8 @@ def field(
 
     """
     path = normalize_path(path, check_keys=True)
+    if not path:
+        raise ValueError("Expected a non-empty path.")
     if isinstance(values, str):
         raise ValueError("values must be iterable, but got a string")
 
@@ -462,14 +682,20 @@ def field(
         values = list(values)
         for value in values:
             # Note: DefaultValue is hashable
-            if not isinstance(value, pydantic.BaseModel | Hashable):
+            if not isinstance(value, _FIELD_VALUE_TYPES):
                 raise ValueError(
                     f"Value {value} of type {type(value)} is not hashable, which can "
                     f"cause unexpected behaviors. You can disable this check by "
                     f"passing `check=False` as a keyword argument."
                 )
 
-    return [nested_dict_at(path, value) for value in values]
+    # Same as nested_dict_at for each value, but the path is already normalized and
+    # we build each level for all values at once.
+    *subpath, key = path
+    configs: list[Config] = [{key: value} for value in values]
+    for part in reversed(subpath):
+        configs = [{part: config} for config in configs]
+    return configs
 
 
 def config_combine(
@@ -480,8 +706,8 @@ def config_combine(
     """Flexible combination of configuration dictionaries.
 
     In contrast to the more specific functions below, this allows you to flexibly use
-    existing functions from ``itertools`` in order to create new combiners. All
-    existing combiners build on top of this function.
+    existing functions from ``itertools`` in order to create new combiners. The
+    existing combiners behave as if they were built on top of this function.
 
     The output of this function is a valid input to both itself and other combiner
     functions.
@@ -502,22 +728,68 @@ def config_combine(
     list[Config]:
         A list of new configuration objects after combining or chaining.
     """
+    if combiner is itertools.product and chainer is None:
+        return config_product(*configs)
+    return list(iter_config_combine(*configs, combiner=combiner, chainer=chainer))
+
+
+def iter_config_combine(
+    *configs: Iterable[Config],
+    combiner: Combiner | None = None,
+    chainer: Chainer | None = None,
+) -> Iterator[Config]:
+    """Lazy version of `config_combine`.
+
+    Yields the configurations one by one instead of returning a list. Together with
+    `initialize_iter`, this avoids holding all configurations of a large sweep in
+    memory at the same time. The arguments are checked right away.
+
+    >>> configs = iter_config_combine(
+    ...     field("a", [1, 2]), field("b", [3, 4]), combiner=itertools.product
+    ... )
+    >>> next(configs)
+    {'a': 1, 'b': 3}
+
+    Parameters
+    ----------
+    configs :
+        The configurations we want to combine.
+    combiner :
+        A function that takes as input multiple iterables and yields tuples.
+        For example: ``itertools.product``.
+    chainer :
+        A function that takes as input multiple iterables and yields a single new
+        iterable. For example: ``itertools.chain``.
+    """
     if combiner is not None:
         if chainer is not None:
             raise ValueError("Can only provide `combiner` or `chainer`, not both")
-        return [merge_nested_dicts(*combo) for combo in combiner(*configs)]
+        return (merge_nested_dicts(*combo) for combo in combiner(*configs))
     elif chainer is not None:
-        res = list(chainer(*configs))
-        if not isinstance(res[0], dict):
-            raise ValueError(
-                f"Chained items are not dictionaries, but {type(res[0])}. Are you sure "
-                f"that you passed a valid chainer function? "
-            )
-        return res
+        return _iter_chained(chainer(*configs))
     else:
         raise ValueError("Must provide one of `single_out` or `multi_out`")
 
 
+def _iter_chained(chained: Iterable[Any], /) -> Iterator[Config]:
+    """Yield chained configs, but check that the chainer yields dictionaries."""
+    iterator = iter(chained)
+    for first in iterator:
+        _check_chained(first)
+        yield first
+        break
+    yield from iterator
+
+
+def _check_chained(item: Any, /) -> None:
+    """Check that an item returned by a chainer is a config dictionary."""
+    if not isinstance(item, dict):
+        raise ValueError(
+            f"Chained items are not dictionaries, but {type(item)}. Are you sure "
+            f"that you passed a valid chainer function? "
+        )
+
+
 def config_product(*configs: Iterable[Config]) -> list[Config]:
     """A product of existing configuration dictionaries.
 
@@ -530,11 +802,51 @@ def config_product(*configs: Iterable[Config]) -> list[Config]:
     The output of this function is a valid input to both itself and other combiner
     functions.
     """
-    return config_combine(*configs, combiner=itertools.product)
+    factors = [list(factor) for factor in configs]
+    if not all(factors):
+        # The product is empty, no need to inspect or flatten the other inputs
+        return []
+
+    if _disjoint_keys(factors):
+        # Fast path: Without overlapping keys, a shallow merge is equivalent to
+        # merge_nested_dicts. We still copy sub-dictionaries to avoid shared state.
+        return [
+            {
+                key: _copy_nested(value) if isinstance(value, dict) else value
+                for config in combo
+                for key, value in config.items()
+            }
+            for combo in itertools.product(*factors)
+        ]
+
+    # Flatten each config only once, rather than once for every combination it is in.
+    # This is what merge_nested_dicts does internally.
+    factor_items = [
+        [list(nested_dict_items(config)) for config in factor] for factor in factors
+    ]
+    return [
+        nested_dict_from_items(itertools.chain.from_iterable(combo))
+        for combo in itertools.product(*factor_items)
+    ]
+
 
+def _disjoint_keys(factors: list[list[Config]], /) -> bool:
+    """Whether the top-level keys of normalized configs are disjoint across factors.
 
-def _safe_zip(*configs: Iterable[Config]) -> Iterable[tuple[Config, ...]]:
-    return zip(*configs, strict=True)
+    This is the common case of ``config_product(field("a", ...), field("b", ...))``.
+    Anything that is not a dictionary is left to the error checking of the slow path.
+    """
+    seen: set[str] = set()
+    for factor in factors:
+        keys: set[str] = set()
+        for config in factor:
+            if not isinstance(config, dict) or not _is_normalized(config):
+                return False
+            keys.update(config)
+        if not seen.isdisjoint(keys):
+            return False
+        seen |= keys
+    return True
 
 
 def config_zip(*configs: Iterable[Config]) -> list[Config]:
@@ -543,7 +855,7 @@ def config_zip(*configs: Iterable[Config]) -> list[Config]:
     >>> config_zip(field("a", [1, 2]), field("b", [3, 4]))
     [{'a': 1, 'b': 3}, {'a': 2, 'b': 4}]
     """
-    return config_combine(*configs, combiner=_safe_zip)
+    return [merge_nested_dicts(*combo) for combo in zip(*configs, strict=True)]
 
 
 def config_chain(*configs: Iterable[Config]) -> list[Config]:
@@ -552,7 +864,10 @@ def config_chain(*configs: Iterable[Config]) -> list[Config]:
     >>> config_chain(field("a", [1, 2]), field("b", [3, 4]))
     [{'a': 1}, {'a': 2}, {'b': 3}, {'b': 4}]
     """
-    return config_combine(*configs, chainer=itertools.chain)
+    res = list(itertools.chain(*configs))
+    if res:
+        _check_chained(res[0])
+    return res
 
 
 def config_roundrobin(*configs: Iterable[Config]) -> list[Config]:
@@ -564,7 +879,16 @@ def config_roundrobin(*configs: Iterable[Config]) -> list[Config]:
     >>> config_roundrobin(field("a", [1, 2, 3]), field("b", [3, 4]))
     [{'a': 1}, {'b': 3}, {'a': 2}, {'b': 4}, {'a': 3}]
     """
-    return config_combine(*configs, chainer=more_itertools.roundrobin)
+    # Only needed here, so avoid the import cost for everyone else
+    from more_itertools import roundrobin
+
+    res = list(roundrobin(*configs))
+    if res:
+        _check_chained(res[0])
+    return res
+
+
+_MODEL_OR_CONFIG = (pydantic.BaseModel, dict)
 
 
 def check_unique(
@@ -586,17 +910,19 @@ def check_unique(
     ValueError
         If models are not unique.
     """
-    seen = set()
+    # Store the hashable representations rather than their hash values, so that
+    # hash collisions cannot be mistaken for duplicates.
+    seen: set[Hashable] = set()
     for models in models_:
-        if isinstance(models, pydantic.BaseModel | dict):
+        if isinstance(models, _MODEL_OR_CONFIG):
             models = [models]
         for model in models:
-            model_hash = hash(as_hashable(model))
-            if model_hash in seen:
+            key = as_hashable(model)
+            if key in seen:
                 if raise_exception:
                     raise ValueError(f"The following model is not unique: {model}.")
                 else:
                     return False
-            seen.add(model_hash)
+            seen.add(key)
 
     return True
@@ -8,6 +8,7 @@ from typing import Any
 import pydantic
 
 from pydantic_sweep._nested_dict import nested_dict_from_items
+from pydantic_sweep._utils import model_field_names
 from pydantic_sweep.types import StrictPath
 
 __all__ = [
@@ -41,7 +42,7 @@ def _model_diff_iter(
     match m1:
         case pydantic.BaseModel():
             # Thanks to previous check, we know they have the same keys
-            for name in cls.model_fields:
+            for name in model_field_names(cls):
                 value1 = getattr(m1, name)
                 value2 = getattr(m2, name)
                 yield from _model_diff_iter(
@@ -1,8 +1,8 @@
 from __future__ import annotations
 
-import copy
+import functools
 import itertools
-import re
+import sys
 import typing
 from collections.abc import Iterable, Iterator
 from typing import Any, Literal, TypeVar, overload
@@ -30,20 +30,37 @@ GenericUnion = type(T | str)
 SpecialGenericAlias = type(typing.List[str])  # noqa: UP006
 """Old-style GenericAlias"""
 
-valid_key_pattern = r"[A-Za-z_][A-Za-z0-9_]*"
-# Valid python keys starts with letters and can contain numbers and underscores after
-_STR_PATH_PATTERN = re.compile(rf"^{valid_key_pattern}(\.{valid_key_pattern})*$")
-_STR_KEY_PATTERN = re.compile(rf"^{valid_key_pattern}$")
-# Explanation:
-# ^ - Matches the start of the string.
-# We first match a valid key, followed by dot-seperated valid keys
-# $ - Matches the end of the string.
+
+def _is_valid_key(key: Any, /) -> bool:
+    """Whether a key is a valid (ASCII) Python identifier.
+
+    This is the same as matching ``[A-Za-z_][A-Za-z0-9_]*``, but much faster.
+    """
+    return isinstance(key, str) and key.isascii() and key.isidentifier()
 
 
 def path_to_str(p: Path, /) -> str:
     return p if isinstance(p, str) else ".".join(p)
 
 
+@functools.lru_cache(maxsize=1024)
+def _normalize_str_path(path: str, /) -> StrictPath:
+    """Normalize a dot-separated string path.
+
+    Every key of every config passes through here when configs are flattened, but
+    there are only a few distinct keys, so the results are cached.
+    """
+    keys = path.split(".")
+    if not all(map(_is_valid_key, keys)):
+        raise ValueError(
+            "If provided as a string, the path must consist only of "
+            f"dot-separated keys. For example, 'my.key'. Got {path})"
+        )
+    # Keys end up in every generated config, interning them makes the
+    # dictionary lookups during merging cheap identity comparisons.
+    return tuple(map(sys.intern, keys))
+
+
 def normalize_path(path: Path, /, *, check_keys: bool = False) -> StrictPath:
     """Normalize a path to a tuple of strings.
 
@@ -54,24 +71,16 @@ def normalize_path(path: Path, /, *, check_keys: bool = False) -> StrictPath:
     check_keys :
         If ``True``, also check each individual key in a tuple path.
     """
-    match path:
-        case str():
-            if not re.fullmatch(_STR_PATH_PATTERN, path):
-                raise ValueError(
-                    "If provided as a string, the path must consist only of "
-                    f"dot-separated keys. For example, 'my.key'. Got {path})"
-                )
-            return tuple(path.split("."))
-        case tuple():
-            pass
-        case Iterable():
-            path = tuple(path)
-        case _:
+    if isinstance(path, str):
+        return _normalize_str_path(path)
+    if not isinstance(path, tuple):
+        if not isinstance(path, Iterable):
             raise ValueError(f"Expected a path, got {path}")
+        path = tuple(path)
 
     if check_keys:
         for p in path:
-            if not re.fullmatch(_STR_KEY_PATTERN, p):
+            if not _is_valid_key(p):
                 raise ValueError(
                     f"Paths can only contain letters and underscores, got {p}."
                 )
@@ -165,10 +174,12 @@ def nested_dict_replace(
         The new value to set at the path.
     inplace :
         If ``True``, modify the input dictionary inplace. Otherwise, return a new
-        dictionary with the value replaced.
+        dictionary with the value replaced. Only the dictionaries are copied, leaf
+        values are shared with the input.
     """
     if not inplace:
-        d = copy.deepcopy(d)
+        # Leaf values are immutable by convention, so we only copy the dictionaries
+        d = _copy_nested(d)
 
     *subpath, key = normalize_path(path)
     sub = nested_dict_get(d, path=subpath, leaf=False)
@@ -192,10 +203,12 @@ def nested_dict_drop(d: Config, /, path: Path, *, inplace: bool = False) -> Conf
         The path to the key to remove.
     inplace :
         If ``True``, modify the input dictionary inplace. Otherwise, return a new
-        dictionary with the key removed.
+        dictionary with the key removed. Only the dictionaries are copied, leaf
+        values are shared with the input.
     """
     if not inplace:
-        d = copy.deepcopy(d)
+        # Leaf values are immutable by convention, so we only copy the dictionaries
+        d = _copy_nested(d)
 
     *subpath, key = normalize_path(path)
     sub = nested_dict_get(d, path=subpath, leaf=False)
@@ -209,9 +222,21 @@ def nested_dict_drop(d: Config, /, path: Path, *, inplace: bool = False) -> Conf
 
 
 def nested_dict_at(path: Path, value: FieldValue) -> Config:
-    """Return nested dictionary with the value at path."""
+    """Return nested dictionary with the value at path.
+
+    >>> nested_dict_at("a.b", 1)
+    {'a': {'b': 1}}
+    """
     path = normalize_path(path)
-    return nested_dict_from_items([(path, value)])
+    if not path:
+        raise ValueError(f"Expected a non-empty path for value {value}.")
+
+    # A single item cannot conflict, so we build the dictionary inside-out directly
+    *subpath, key = path
+    res: Config = {key: value}
+    for part in reversed(subpath):
+        res = {part: res}
+    return res
 
 
 def nested_dict_from_items(
@@ -221,24 +246,36 @@ def nested_dict_from_items(
 
     Paths are assumed as single dot-separated strings.
     """
-    result: dict[str, Any] = dict()
+    result: dict[str, Any] = {}
+
+    # Items from the same config arrive grouped by their subtree, so we remember the
+    # parent node of the previous item and reuse it for items with the same parent.
+    prev_path: StrictPath | None = None
+    prev_node = result
 
     for full_path, value in items:
-        *path, key = full_path
-        node = result
+        if not full_path:
+            raise ValueError(f"Expected a non-empty path for value {value}.")
+        path = full_path[:-1]
+        key = full_path[-1]
 
-        for part in path:
-            if part not in node:
-                node[part] = dict()
+        if path == prev_path:
+            node = prev_node
+        else:
+            node = result
+            for part in path:
+                if part not in node:
+                    node[part] = {}
 
-            node = node[part]
+                node = node[part]
 
-            if not isinstance(node, dict):
-                raise ValueError(
-                    f"In the configs, for '{path_to_str(path)}' there are both a "
-                    f"value ({node}) and child nodes with values defined. "
-                    "This means that these two configs would overwrite each other."
-                )
+                if not isinstance(node, dict):
+                    raise ValueError(
+                        f"In the configs, for '{path_to_str(path)}' there are both a "
+                        f"value ({node}) and child nodes with values defined. This "
+                        "means that these two configs would overwrite each other."
+                    )
+            prev_path, prev_node = path, node
 
         if key in node:
             if isinstance(node[key], dict):
@@ -300,25 +337,72 @@ def merge_nested_dicts(
     >>> merge_nested_dicts(dict(a=dict(b=2)), dict(a=5), overwrite=True)
     {'a': 5}
     """
+    # Empty configs do not contribute anything, and a single remaining config that is
+    # already normalized only needs to be copied. Anything that is not a dictionary
+    # is kept, so that nested_dict_items raises for it.
+    nonempty = [d for d in dicts if d or not isinstance(d, dict)]
+    if (
+        len(nonempty) == 1
+        and isinstance(nonempty[0], dict)
+        and _is_normalized(nonempty[0])
+    ):
+        return _copy_nested(typing.cast(Config, nonempty[0]))
+
     if not overwrite:
         return nested_dict_from_items(
-            itertools.chain.from_iterable(nested_dict_items(d) for d in dicts)
+            itertools.chain.from_iterable(nested_dict_items(d) for d in nonempty)
         )
 
-    res: Config = dict()
-    for d in dicts:
-        for path, value in nested_dict_items(d):
-            node: dict = res
-            *subpath, final = path
-            for key in subpath:
-                if key not in node or not isinstance(node[key], dict):
-                    node[key] = dict()
-                node = node[key]
-            node[final] = value
+    return _nested_dict_from_items_overwrite(
+        itertools.chain.from_iterable(nested_dict_items(d) for d in nonempty)
+    )
+
+
+def _nested_dict_from_items_overwrite(
+    items: Iterable[tuple[StrictPath, FieldValue]], /
+) -> Config:
+    """Like nested_dict_from_items, but later items overwrite earlier ones."""
+    res: Config = {}
+    for path, value in items:
+        node: dict = res
+        *subpath, final = path
+        for key in subpath:
+            sub = node.get(key)
+            if not isinstance(sub, dict):
+                sub = node[key] = {}
+            node = sub
+        node[final] = value
 
     return res
 
 
+def _is_normalized(d: FlexibleConfig | Config, /) -> bool:
+    """Whether a config is already in the normalized nested form.
+
+    That is, all keys are single valid keys and there are no empty sub-dictionaries,
+    so that ``nested_dict_from_items(nested_dict_items(d))`` would reproduce it.
+
+    >>> _is_normalized({"a": {"b": 1}})
+    True
+    >>> _is_normalized({"a.b": 1})
+    False
+    """
+    for key, value in d.items():
+        if not _is_valid_key(key):
+            return False
+        if isinstance(value, dict) and not (value and _is_normalized(value)):
+            return False
+    return True
+
+
+def _copy_nested(d: Config, /) -> Config:
+    """Copy the dictionaries of a nested config, but not the leaf values."""
+    return {
+        key: _copy_nested(value) if isinstance(value, dict) else value
+        for key, value in d.items()
+    }
+
+
 class _NoSkip:
     pass
 
@@ -5,6 +5,7 @@ import random
 import types
 import typing
 import warnings
+import weakref
 from collections.abc import Hashable, Iterable, Iterator
 from typing import Any, Literal, TypeVar
 
@@ -14,6 +15,7 @@ from typing_extensions import Self
 __all__ = [
     "as_hashable",
     "items_skip",
+    "model_field_names",
     "notebook_link",
     "raise_warn_ignore",
     "random_seeds",
@@ -34,9 +36,36 @@ V = TypeVar("V")
 
 def items_skip(items: Iterable[tuple[K, V]], target: Any) -> Iterator[tuple[K, V]]:
     """Yield items skipping certain targets."""
-    for key, value in items:
-        if value is not target:
-            yield key, value
+    # Passing the items through unchanged avoids unpacking and re-packing each tuple
+    return (item for item in items if item[1] is not target)
+
+
+_MODEL_FIELD_NAMES: weakref.WeakKeyDictionary[
+    type[pydantic.BaseModel], tuple[str, ...]
+] = weakref.WeakKeyDictionary()
+
+
+def model_field_names(cls: type[pydantic.BaseModel], /) -> tuple[str, ...]:
+    """Return the field names of a pydantic model class.
+
+    Accessing ``model_fields`` goes through a pydantic descriptor, so we cache the
+    names of complete models per class.
+    """
+    try:
+        return _MODEL_FIELD_NAMES[cls]
+    except KeyError:
+        pass
+
+    names = tuple(cls.model_fields)
+    if cls.__pydantic_complete__:
+        _MODEL_FIELD_NAMES[cls] = names
+    return names
+
+
+_SCALAR_TYPES = frozenset({bool, int, float, str, bytes, type(None)})
+"""Builtin scalar types, which are immutable and hashable leaf values."""
+
+_HASHABLE_LEAF_TYPES = _SCALAR_TYPES | {tuple}
 
 
 def as_hashable(item: Any, /) -> Hashable:
@@ -56,6 +85,10 @@ def as_hashable(item: Any, /) -> Hashable:
     Hashable
         A hashable representation of the item.
     """
+    # Scalars and tuples are already hashable, so there is nothing to convert
+    if type(item) in _HASHABLE_LEAF_TYPES:
+        return item
+
     match item:
         case Hashable():
             return item
@@ -65,7 +98,7 @@ def as_hashable(item: Any, /) -> Hashable:
             # order is deterministic
             model_dump = tuple(
                 (key, as_hashable(getattr(item, key)))
-                for key in item.__class__.model_fields
+                for key in model_field_names(type(item))
             )
             return f"pydantic:{item.__class__}:{model_dump}"
         case dict():
@@ -48,8 +48,10 @@ def load(source: os.PathLike | str, /, *, model: str) -> pydantic.BaseModel:
     elif source.suffix in {".yaml", ".yml"}:
         import yaml  # type: ignore[import-untyped]
 
+        # Prefer the C implementation if PyYAML was built with libyaml
+        loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
         with source.open("r") as file:
-            content = yaml.safe_load(file)
+            content = yaml.load(file, Loader=loader)
 
         cls = _import_module(model)
         return cls(**content)
@@ -107,8 +109,11 @@ def write(
     elif target.suffix in {".yaml", ".yml"}:
         import yaml
 
-        if yaml_options is None:
-            yaml_options = dict()
+        # Prefer the C implementation if PyYAML was built with libyaml
+        yaml_options = {
+            "Dumper": getattr(yaml, "CSafeDumper", yaml.SafeDumper),
+            **(yaml_options or {}),
+        }
         # This runs serializers properly (e.g., for Path / Enum objects)
         dump = model.model_dump(
             mode="json", exclude_unset=exclude_unset, exclude_defaults=exclude_defaults
@@ -134,7 +139,7 @@ def write(
         raise ValueError(f"Unsupported file type: {target.suffix}")
 
 
-class Config(pydantic.BaseModel, extra="forbid"):
+class Config(pydantic.BaseModel, extra="forbid", defer_build=True):
     """Command line configuratio nobject"""
 
     source: Path
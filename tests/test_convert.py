@@ -8,7 +8,7 @@ import pydantic
 import pytest
 
 from pydantic_sweep import BaseModel, convert
-from pydantic_sweep._generation import model_to_python
+from pydantic_sweep._generation import _generate_imports, model_to_python
 
 
 class MyEnum(enum.Enum):
@@ -84,6 +84,16 @@ class TestModelToPython:
             NestedModel(hidden_sub=[Model(x=1, c=dict(a=5), a={1, "a"})])
         )
 
+    def test_imports(self):
+        assert _generate_imports([Model, NestedModel]) == [
+            f"from {__name__} import Model",
+            f"from {__name__} import NestedModel",
+        ]
+
+        duplicate = type("Model", (), {})
+        with pytest.raises(ValueError, match="Model"):
+            _generate_imports([Model, NestedModel, duplicate])
+
 
 @pytest.mark.parametrize("ext", ["json", "yaml", "yml", "py", "toml"])
 def test_conversion(tmp_path, ext):
@@ -3,6 +3,8 @@ import subprocess
 import sys
 from pathlib import Path
 
+import pytest
+
 from pydantic_sweep import __version__
 
 _EXPERIMENT_DIR = Path(__file__).parents[1] / "example"
@@ -23,9 +25,10 @@ def test_script_version():
                     assert match is not None, f"Version not correct: {line}"
 
 
-def test_script_run():
+@pytest.mark.parametrize("args", [[], ["--in-process"]])
+def test_script_run(args):
     res = subprocess.run(
-        [sys.executable, str(_EXPERIMENT_DIR / "runner.py")],
+        [sys.executable, str(_EXPERIMENT_DIR / "runner.py"), *args],
         check=True,
         capture_output=True,
         text=True,
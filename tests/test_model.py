@@ -1,4 +1,7 @@
+import gc
+import itertools
 import typing
+import weakref
 from typing import Annotated, Any, Generic, Literal, TypeVar
 
 import pydantic
@@ -7,16 +10,21 @@ import typing_extensions
 from pydantic import Discriminator, Tag, ValidationError
 
 from pydantic_sweep._model import (
+    _BATCH_VALIDATION_SIZE,
     BaseModel,
     DefaultValue,
+    _union_validation_plan,
     check_model,
     check_unique,
     config_chain,
+    config_combine,
     config_product,
     config_roundrobin,
     config_zip,
     field,
     initialize,
+    initialize_iter,
+    iter_config_combine,
     model_replace,
 )
 
@@ -102,6 +110,29 @@ class TestBaseModel:
 
         assert Model(d=dict(x=1.0)) == Model(d=Sub(x=1.0))
 
+    def test_union_validation_plan(self):
+        class Sub1(BaseModel):
+            x: int
+
+        class Sub2(BaseModel):
+            x: int
+
+        class Model(BaseModel):
+            a: Sub1 | Sub2
+            b: Sub1 | None
+            c: Sub1
+            d: Annotated[
+                Annotated[Sub1, Tag("sub1")] | Annotated[Sub2, Tag("sub2")],
+                Discriminator(lambda *args: "sub1"),
+            ]
+
+        plan = _union_validation_plan(Model)
+        assert {key: [ref() for ref in value] for key, value in plan.items()} == {
+            "a": [Sub1, Sub2],
+            "b": [Sub1],
+        }
+        assert _union_validation_plan(Model) is plan
+
 
 class TestCheckModel:
     def test_complex(self):
@@ -177,6 +208,20 @@ class TestCheckModel:
         with pytest.raises(ValueError):
             check_model(Nested)
 
+    def test_same_name(self):
+        def make_sub(base):
+            class Sub(base):
+                x: int
+
+            return Sub
+
+        class Model(BaseModel):
+            a: make_sub(pydantic.BaseModel)
+            b: make_sub(BaseModel)
+
+        with pytest.raises(ValueError, match="`a`"):
+            check_model(Model)
+
     def test_arbitrary(self):
         class A(pydantic.BaseModel, extra="forbid"):
             x: int = 5
@@ -191,6 +236,43 @@ class TestCheckModel:
         with pytest.raises(ValueError):
             check_model(A())
 
+    def test_cached(self):
+        class Sub(pydantic.BaseModel, extra="forbid"):
+            x: list[int]
+
+        class Model(BaseModel):
+            sub: Sub
+
+        check_model(Model, unhashable="ignore")
+        check_model(Model, unhashable="ignore")
+
+        # Repeated checks still report unhashable types
+        with pytest.warns(UserWarning, match="`sub.x`"):
+            check_model(Model)
+
+        # Configs are mutable, so they are re-checked
+        Sub.model_config["extra"] = "allow"
+        with pytest.raises(ValueError, match="`sub`"):
+            check_model(Model, unhashable="ignore")
+
+    def test_cache_releases_models(self):
+        def make_model():
+            class Sub(BaseModel):
+                x: int = 0
+
+            class Node(BaseModel):
+                child: "Node | Sub | None" = None
+
+            Node.model_rebuild()
+            check_model(Node)
+            initialize(Node, [dict(child=dict(x=1))])
+            return weakref.ref(Node)
+
+        # Caches must not keep recursive models alive through their own entries
+        ref = make_model()
+        gc.collect()
+        assert ref() is None
+
     def test_generic(self):
         T = TypeVar("T")
 
@@ -308,6 +390,10 @@ class TestField:
         with pytest.raises(ValueError):
             field("a-b", [1])
 
+        for values in ([], [1]):
+            with pytest.raises(ValueError, match="non-empty path"):
+                field((), values)
+
     def test_basic(self):
         assert field("a", []) == []
         assert field("a", [1, 2]) == [dict(a=1), dict(a=2)]
@@ -388,6 +474,68 @@ class TestInitialize:
         m1.sub.x = 10
         assert m2.sub.x == 5
 
+    def test_inputs_unchanged(self):
+        class Sub1(BaseModel):
+            x: int
+
+        class Sub2(BaseModel):
+            y: int
+
+        class Model(BaseModel):
+            sub: Sub1 | Sub2 = Sub1(x=0)
+            z: int = 0
+
+        configs = [dict(sub=dict(x=1), z=DefaultValue), dict(sub=dict(y=2))]
+        res = initialize(Model, configs)
+        assert res == [Model(sub=Sub1(x=1)), Model(sub=Sub2(y=2))]
+        assert configs == [dict(sub=dict(x=1), z=DefaultValue), dict(sub=dict(y=2))]
+
+    def test_inputs_unchanged_by_validators(self):
+        class Sub(BaseModel):
+            x: int
+
+        class Model(BaseModel):
+            x: int
+            y: int = 0
+            sub: Sub = Sub(x=0)
+
+            @pydantic.model_validator(mode="before")
+            @classmethod
+            def _set_y(cls, data: Any) -> Any:
+                data["y"] = data["x"] * 2
+                return data
+
+        configs = field("x", [1, 2])
+        assert initialize(Model, configs) == [Model(x=1), Model(x=2)]
+        assert list(initialize_iter(Model, configs)) == [Model(x=1), Model(x=2)]
+        assert configs == [dict(x=1), dict(x=2)]
+
+        configs = [dict(model=dict(x=1))]
+        assert initialize(Model, configs, at="model") == [dict(model=Model(x=1))]
+        assert configs == [dict(model=dict(x=1))]
+
+    def test_prune_default(self):
+        class Sub(BaseModel):
+            x: int = 1
+
+        class Model(BaseModel):
+            sub: Sub = Sub(x=5)
+            y: int = 0
+
+        # Empty sub-configs are dropped, so the model default is used
+        assert initialize(Model, [dict(sub=dict(x=DefaultValue))]) == [Model()]
+        assert initialize(Model, [dict(sub=dict())]) == [Model()]
+        assert initialize(Model, [{"sub.x": 2, "y": DefaultValue}]) == [
+            Model(sub=Sub(x=2))
+        ]
+
+        # Errors in nested flexible keys report the full path
+        with pytest.raises(ValueError, match=r"'sub\.x'"):
+            initialize(Model, [{"sub": {"x": 1, "x.y": 2}}])
+
+        with pytest.raises(TypeError, match="Expected a dictionary"):
+            initialize(Model, [None])
+
     def test_default(self):
         class Sub(BaseModel):
             x: int
@@ -399,6 +547,10 @@ class TestInitialize:
         res = initialize(Model, field("sub.x", [1]), default=dict(y=10))
         assert res == [Model(sub=Sub(x=1), y=10)]
 
+        # Configs take precedence over nested defaults
+        res = initialize(Model, field("sub.x", [1, 2]), default={"sub.x": 0, "y": 3})
+        assert res == [Model(sub=Sub(x=1), y=3), Model(sub=Sub(x=2), y=3)]
+
         # Default as default value should not have any effect
         res = initialize(Model, field("sub.x", [1]), default=dict(y=DefaultValue))
         assert res == [Model(sub=Sub(x=1), y=0)]
@@ -471,6 +623,68 @@ class TestInitialize:
         model = initialize(Model, sub)
         assert model == [Model(s=Sub(x=0))]
 
+    def test_validation_error(self):
+        calls = []
+
+        class Model(BaseModel):
+            x: int
+
+            @pydantic.field_validator("x")
+            @classmethod
+            def _count(cls, x: int) -> int:
+                calls.append(x)
+                return x
+
+        assert initialize(Model, field("x", [1, 2])) == [Model(x=1), Model(x=2)]
+
+        # Errors are reported for the individual model
+        with pytest.raises(ValidationError) as exc_info:
+            initialize(Model, [dict(x=1), dict(x="a")])
+        assert exc_info.value.title == "Model"
+
+        # Same for large sweeps, which are validated as a batch
+        configs = field("x", range(_BATCH_VALIDATION_SIZE))
+        assert initialize(Model, configs) == [Model(x=i) for i in range(len(configs))]
+        calls.clear()
+        with pytest.raises(ValidationError) as exc_info:
+            initialize(Model, [*configs, dict(x="a"), dict(x="b")])
+        assert exc_info.value.title == "Model"
+        assert exc_info.value.errors()[0]["input"] == "a"
+        # Only the invalid config is validated again
+        assert len(calls) == len(configs)
+
+    @pytest.mark.parametrize("n", [1, _BATCH_VALIDATION_SIZE])
+    def test_incomplete(self, n):
+        class Model(BaseModel):
+            x: "Undefined"  # type: ignore[name-defined]  # noqa: F821
+
+        with pytest.raises(pydantic.PydanticUserError, match="`Model` is not fully"):
+            initialize(Model, [dict(x=1)] * n, check=False)
+
+    def test_iter(self):
+        class Model(BaseModel):
+            x: int
+            y: int = 0
+
+        configs = field("x", [1, 2])
+        models = initialize_iter(Model, iter(configs), constant={"y": 3})
+        assert list(models) == initialize(Model, configs, constant={"y": 3})
+
+        # Infinite streams of configs are processed lazily
+        endless = ({"x": x} for x in itertools.count())
+        models = initialize_iter(Model, endless, constant={"y": 3})
+        assert list(itertools.islice(models, 2)) == [Model(x=0, y=3), Model(x=1, y=3)]
+
+        # Arguments are checked eagerly
+        with pytest.raises(TypeError):
+            initialize_iter(Model, configs, default=5)
+
+        # Invalid configs only fail on iteration
+        models = initialize_iter(Model, [dict(x=1), dict(x="a")])
+        assert next(models) == Model(x=1)
+        with pytest.raises(ValidationError):
+            next(models)
+
     def test_at(self):
         class Sub(BaseModel):
             x: int
@@ -482,6 +696,10 @@ class TestInitialize:
         partial = initialize(Sub, values, at="sub")
         assert partial == [dict(sub=Sub(x=0))]
 
+        # Single-use iterables are consumed only once
+        partial = initialize(Sub, iter(values), at="sub", default={"sub.x": 1})
+        assert partial == [dict(sub=Sub(x=0))]
+
     def test_conflicing_args(self):
         class Sub(BaseModel):
             x: int
@@ -499,6 +717,49 @@ def test_config_product():
     with pytest.raises(ValueError):
         config_product(field("a", [1]), field("a", [2]))
 
+    assert config_product(field("a", [1]), []) == []
+    assert config_product() == [{}]
+
+    # Disjoint nested configs do not share sub-dictionaries
+    res = config_product([dict(a=dict(b=1))], field("c", [1, 2]))
+    assert res == [dict(a=dict(b=1), c=1), dict(a=dict(b=1), c=2)]
+    assert res[0]["a"] is not res[1]["a"]
+
+    # Non-normalized keys and empty sub-dictionaries are still merged
+    res = config_product([{"a.b": 1}], [dict(a=dict(c=2), d={})])
+    assert res == [dict(a=dict(b=1, c=2))]
+
+    with pytest.raises(TypeError, match="Expected a dictionary"):
+        config_product([None], field("a", [1]))
+
+
+def test_config_combine():
+    a, b = field("a", [1, 2]), field("b", [3, 4])
+    assert config_combine(a, b, combiner=itertools.product) == config_product(a, b)
+    assert config_combine(a, b, combiner=zip) == config_zip(a, b)
+    assert config_combine(a, b, chainer=itertools.chain) == config_chain(a, b)
+
+    with pytest.raises(ValueError):
+        config_combine(a, b)
+
+
+def test_iter_config_combine():
+    a, b = field("a", [1, 2]), field("b", [3, 4])
+    res = iter_config_combine(a, b, combiner=itertools.product)
+    assert not isinstance(res, list)
+    assert list(res) == config_product(a, b)
+    res = iter_config_combine(a, b, chainer=itertools.chain)
+    assert list(res) == config_chain(a, b)
+
+    # Arguments are checked eagerly
+    with pytest.raises(ValueError):
+        iter_config_combine(a, b)
+    with pytest.raises(ValueError):
+        iter_config_combine(a, b, combiner=zip, chainer=itertools.chain)
+
+    with pytest.raises(ValueError, match="not dictionaries"):
+        list(iter_config_combine(a, b, chainer=zip))
+
 
 def test_config_zip():
     res = config_zip(field("a", [1, 2]), field("b", [3, 4]))
@@ -521,6 +782,11 @@ def test_config_chain():
     res = config_chain(field("a", [1]), field("b", [2]))
     assert res == [dict(a=1), dict(b=2)]
 
+    assert config_chain(field("a", []), field("b", [])) == []
+
+    with pytest.raises(ValueError, match="not dictionaries"):
+        config_chain([1, 2], field("a", [1]))
+
 
 def test_config_roundrobin():
     res = config_roundrobin(field("a", [1, 2]), field("b", [3, 4]))
@@ -530,6 +796,9 @@ def test_config_roundrobin():
     res = config_chain(field("a", [1]), field("b", [2]))
     assert res == [dict(a=1), dict(b=2)]
 
+    with pytest.raises(ValueError, match="not dictionaries"):
+        config_roundrobin([1, 2], field("a", [1]))
+
 
 def test_default_override():
     """Make sure default values cannot be overwritten."""
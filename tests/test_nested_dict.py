@@ -29,6 +29,11 @@ def test_normalize_path():
         normalize_path("a..b")
     with pytest.raises(ValueError):
         normalize_path(".a.b")
+    with pytest.raises(ValueError):
+        normalize_path("a.b\n")
+    # Only ASCII identifiers are valid keys
+    with pytest.raises(ValueError):
+        normalize_path("a.é")
 
     with pytest.raises(ValueError):
         normalize_path(("a", "2"), check_keys=True)
@@ -36,6 +41,8 @@ def test_normalize_path():
         normalize_path(("a.b",), check_keys=True)
     with pytest.raises(ValueError):
         normalize_path(("0a.b",), check_keys=True)
+    with pytest.raises(ValueError):
+        normalize_path(("a", 1), check_keys=True)
 
 
 class TestNormalizeFlexibleConfig:
@@ -102,6 +109,9 @@ def test_nested_dict_at():
     res = nested_dict_at("a.b.c", 5)
     assert res == dict(a=dict(b=dict(c=5)))
 
+    with pytest.raises(ValueError, match="non-empty path"):
+        nested_dict_at((), 5)
+
 
 class TestNestedDictReplace:
     def test_inplace(self):
@@ -122,6 +132,11 @@ class TestNestedDictReplace:
         assert res == expected
         assert d == d_orig, "In-place modification"
 
+        # Sub-dictionaries are not shared
+        d = dict(a=dict(b=1), c=dict(d=2))
+        res = nested_dict_replace(d, "c.d", value=0)
+        assert res["a"] is not d["a"]
+
     def test_empty_path(self):
         d = dict(a=5, b=dict(c=6, d=7))
         with pytest.raises(ValueError):
@@ -153,6 +168,11 @@ class TestNestedDictDrop:
         assert res == expected
         assert d == d_orig, "In-place modification"
 
+        # Sub-dictionaries are not shared
+        d = dict(a=dict(b=1), c=dict(d=2))
+        res = nested_dict_drop(d, "c.d", inplace=False)
+        assert res["a"] is not d["a"]
+
     def test_empty_path(self):
         d = dict(a=5, b=dict(c=6, d=7))
         with pytest.raises(ValueError):
@@ -213,3 +233,18 @@ def test_merge_dicts():
     assert merge_nested_dicts(dict(a=1), dict(b=2), overwrite=True) == dict(a=1, b=2)
     assert merge_nested_dicts(dict(a=1), dict(a=2), overwrite=True) == dict(a=2)
     assert merge_nested_dicts(dict(a=dict(b=2)), dict(a=3), overwrite=True) == dict(a=3)
+
+    # Empty dicts are skipped, but the result never shares sub-dicts with the input
+    d = dict(a=dict(b=1))
+    for res in (merge_nested_dicts(d), merge_nested_dicts({}, d, {})):
+        assert res == d
+        assert res["a"] is not d["a"]
+    assert merge_nested_dicts({"a.b": 1}, {}) == d
+    assert merge_nested_dicts({}, {}) == {}
+
+    # Falsy values that are not dictionaries are still rejected
+    for value in (None, 0):
+        with pytest.raises(TypeError, match="Expected a dictionary"):
+            merge_nested_dicts(value, dict(a=1))
+        with pytest.raises(TypeError, match="Expected a dictionary"):
+            merge_nested_dicts(value)
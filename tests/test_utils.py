@@ -11,6 +11,7 @@ from pydantic_sweep._utils import (
     RaiseWarnIgnore,
     as_hashable,
     iter_subtypes,
+    model_field_names,
     raise_warn_ignore,
     random_seeds,
 )
@@ -75,6 +76,22 @@ class TestAsHashable:
             as_hashable(t)
 
 
+def test_model_field_names():
+    class Model(pydantic.BaseModel):
+        b: int = 0
+        a: "Sub"
+
+    # Incomplete models are not cached
+    assert model_field_names(Model) == ("b", "a")
+
+    class Sub(pydantic.BaseModel):
+        x: int = 0
+
+    Model.model_rebuild()
+    assert model_field_names(Model) == ("b", "a")
+    assert model_field_names(Sub) == ("x",)
+
+
 def test_random_seeds():
     assert set(random_seeds(10, upper=10)) == set(range(10))
     with pytest.raises(ValueError):